@@ -1,8 +1,11 @@
 // Copyright (c) 2010-2020 The Regents of the University of Michigan
 // This file is from the freud project, released under the BSD 3-Clause License.
 
+#include <algorithm>
+#include <cmath>
 #include <complex>
 #include <stdexcept>
+#include <type_traits>
 #ifdef __SSE2__
 #include <emmintrin.h>
 #endif
@@ -18,7 +21,8 @@
 namespace freud { namespace density {
 
 template<typename T>
-CorrelationFunction<T>::CorrelationFunction(unsigned int bins, float r_max) : BondHistogramCompute()
+CorrelationFunction<T>::CorrelationFunction(unsigned int bins, float r_max)
+    : BondHistogramCompute(), m_bins(bins), m_r_max(r_max)
 {
     if (bins == 0)
     {
@@ -36,11 +40,54 @@ CorrelationFunction<T>::CorrelationFunction(unsigned int bins, float r_max) : Bo
     axes.push_back(std::make_shared<util::RegularAxis>(bins, 0, r_max));
     m_histogram = util::Histogram<unsigned int>(axes);
     m_local_histograms = util::Histogram<unsigned int>::ThreadLocalHistogram(m_histogram);
+    m_inv_dr = static_cast<float>(1.0) / (r_max / static_cast<float>(bins));
 
     typename util::Histogram<T>::Axes axes_rdf;
     axes_rdf.push_back(std::make_shared<util::RegularAxis>(bins, 0, r_max));
     m_correlation_function = util::Histogram<T>(axes_rdf);
-    m_local_correlation_function = CFThreadHistogram(m_correlation_function);
+
+    // The thread local correlation functions store the real and imaginary
+    // components in separate arrays. For real-valued correlation functions,
+    // the thread local copies of the imaginary component are never created.
+    util::Histogram<double> component_histogram(axes_rdf);
+    m_local_correlation_real = ComponentThreadHistogram(component_histogram);
+    m_local_correlation_imag = ComponentThreadHistogram(component_histogram);
+}
+
+//! Sum one bin over a set of thread local histograms.
+/*! Neumaier's compensated summation is used so that the result does not
+ *  depend on how the bonds were distributed across threads.
+ */
+inline double compensatedBinSum(util::Histogram<double>::ThreadLocalHistogram& local_histograms, size_t i)
+{
+    double sum(0);
+    double compensation(0);
+    for (auto hist = local_histograms.begin(); hist != local_histograms.end(); ++hist)
+    {
+        const double value = (*hist)[i];
+        const double total = sum + value;
+        if (std::abs(sum) >= std::abs(value))
+        {
+            compensation += (sum - total) + value;
+        }
+        else
+        {
+            compensation += (value - total) + sum;
+        }
+        sum = total;
+    }
+    return sum + compensation;
+}
+
+// Define an overloaded pair of functions to assemble a value from its components.
+inline void fromComponents(double& value, double real, double /*imag*/)
+{
+    value = real;
+}
+
+inline void fromComponents(std::complex<double>& value, double real, double imag)
+{
+    value = {real, imag};
 }
 
 //! \internal
@@ -53,10 +100,17 @@ template<typename T> void CorrelationFunction<T>::reduce()
     // Reduce the bin counts over all threads, then use them to normalize the
     // RDF when computing.
     m_histogram.reduceOverThreads(m_local_histograms);
-    m_correlation_function.reduceOverThreadsPerBin(m_local_correlation_function, [&](size_t i) {
-        if (m_histogram[i])
+
+    // The real and imaginary components are reduced independently.
+    util::forLoopWrapper(0, m_correlation_function.size(), [&](size_t begin, size_t end) {
+        for (size_t i = begin; i < end; ++i)
         {
-            m_correlation_function[i] /= m_histogram[i];
+            fromComponents(m_correlation_function[i], compensatedBinSum(m_local_correlation_real, i),
+                           compensatedBinSum(m_local_correlation_imag, i));
+            if (m_histogram[i])
+            {
+                m_correlation_function[i] /= m_histogram[i];
+            }
         }
     });
 }
@@ -67,13 +121,59 @@ template<typename T> void CorrelationFunction<T>::reset()
 
     // Zero the correlation function in addition to the bin counts that are
     // reset by the parent.
-    m_local_correlation_function.reset();
+    m_local_correlation_real.reset();
+    m_local_correlation_imag.reset();
+}
+
+template<typename T>
+template<typename U>
+void CorrelationFunction<T>::accumulateFrom(const CorrelationFunction<U>& other)
+{
+    // All data is added to the calling thread's local histograms, which are
+    // combined with the rest during the next reduction.
+    auto& local_histogram = m_local_histograms.local();
+    for (auto hist = other.m_local_histograms.begin(); hist != other.m_local_histograms.end(); ++hist)
+    {
+        for (size_t i = 0; i < m_bins; ++i)
+        {
+            local_histogram[i] += (*hist)[i];
+        }
+    }
+
+    auto& local_real = m_local_correlation_real.local();
+    for (auto hist = other.m_local_correlation_real.begin(); hist != other.m_local_correlation_real.end();
+         ++hist)
+    {
+        for (size_t i = 0; i < m_bins; ++i)
+        {
+            local_real[i] += (*hist)[i];
+        }
+    }
+
+    auto& local_imag = m_local_correlation_imag.local();
+    for (auto hist = other.m_local_correlation_imag.begin(); hist != other.m_local_correlation_imag.end();
+         ++hist)
+    {
+        for (size_t i = 0; i < m_bins; ++i)
+        {
+            local_imag[i] += (*hist)[i];
+        }
+    }
+
+    m_box = other.m_box;
+    m_frame_counter += other.m_frame_counter;
+    m_n_points = other.m_n_points;
+    m_n_query_points = other.m_n_query_points;
+    m_reduce = true;
 }
 
 // Define an overloaded pair of product functions to deal with complex conjugation if necessary.
+// The complex product is written out in terms of its components because the
+// std::complex operator* must handle infinities and NaNs per Annex G of the C
+// standard, which prevents it from being inlined into the bond loop.
 inline std::complex<double> product(std::complex<double> x, std::complex<double> y)
 {
-    return std::conj(x) * y;
+    return {x.real() * y.real() + x.imag() * y.imag(), x.real() * y.imag() - x.imag() * y.real()};
 }
 
 inline double product(double x, double y)
@@ -88,18 +188,46 @@ void CorrelationFunction<T>::accumulate(const freud::locality::NeighborQuery* ne
                                         const freud::locality::NeighborList* nlist,
                                         freud::locality::QueryArgs qargs)
 {
-    accumulateGeneral(
+    // Bin the bond distances directly with the precomputed inverse bin width
+    // rather than through Histogram::bin, which constructs a vector of values
+    // for every bond. This matches the binning of util::RegularAxis exactly.
+    const float r_max = m_r_max;
+    const float inv_dr = m_inv_dr;
+    const size_t bins = m_bins;
+    const bool is_complex = std::is_same<T, std::complex<double>>::value;
+    accumulateGeneralIterator(
         neighbor_query, query_points, n_query_points, nlist, qargs,
-        [=](const freud::locality::NeighborBond& neighbor_bond) {
-            size_t value_bin = m_histogram.bin({neighbor_bond.distance});
-            m_local_histograms.increment(value_bin);
-            m_local_correlation_function.increment(
-                value_bin,
-                product(values[neighbor_bond.point_idx], query_values[neighbor_bond.query_point_idx]));
+        [=](size_t query_point_idx,
+            const std::shared_ptr<freud::locality::NeighborPerPointIterator>& ppiter) {
+            // Look up the thread local histograms once for all bonds of this
+            // query point instead of once per bond. The imaginary part is
+            // only created for complex values.
+            auto& local_histogram = m_local_histograms.local();
+            auto& local_real = m_local_correlation_real.local();
+            util::Histogram<double>* local_imag = is_complex ? &m_local_correlation_imag.local() : nullptr;
+            const T query_value = query_values[query_point_idx];
+
+            for (freud::locality::NeighborBond nb = ppiter->next(); !ppiter->end(); nb = ppiter->next())
+            {
+                if (nb.distance < 0 || nb.distance >= r_max)
+                {
+                    continue;
+                }
+                const size_t value_bin = std::min(static_cast<size_t>(nb.distance * inv_dr), bins - 1);
+                const T value = product(values[nb.point_idx], query_value);
+                local_histogram[value_bin] += 1;
+                local_real[value_bin] += std::real(value);
+                if (is_complex)
+                {
+                    (*local_imag)[value_bin] += std::imag(value);
+                }
+            }
         });
 }
 
 template class CorrelationFunction<std::complex<double>>;
 template class CorrelationFunction<double>;
+template void
+CorrelationFunction<std::complex<double>>::accumulateFrom(const CorrelationFunction<double>& other);
 
 }; }; // end namespace freud::density
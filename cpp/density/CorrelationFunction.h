@@ -42,6 +42,17 @@ namespace freud { namespace density {
     for both points and ref_points, we omit accumulating the
     self-correlation value in the first bin.
 
+    <b>Real and complex values:</b><br>
+    The class is instantiated separately for real and complex values so
+    that the product of values in the bond loop is statically typed.
+
+    <b>Precision:</b><br>
+    The thread local accumulators are kept in double precision to match
+    the precision of the input values. Each accumulator holds one entry
+    per bin, so it stays cache resident and a narrower type would not
+    reduce memory traffic in the bond loop. Only the real component is
+    allocated for real-valued correlation functions.
+
 */
 template<typename T> class CorrelationFunction : public locality::BondHistogramCompute
 {
@@ -60,6 +71,12 @@ public:
                     const vec3<float>* query_points, const T* query_values, unsigned int n_query_points,
                     const freud::locality::NeighborList* nlist, freud::locality::QueryArgs qargs);
 
+    //! Add the data accumulated by another correlation function to this one.
+    /*! This allows a real-valued correlation function to be promoted to a
+     *  complex-valued one partway through accumulating over multiple frames.
+     */
+    template<typename U> void accumulateFrom(const CorrelationFunction<U>& other);
+
     //! \internal
     //! helper function to reduce the thread specific arrays into one array
     void reduce() override;
@@ -71,11 +88,18 @@ public:
     }
 
 private:
+    template<typename U> friend class CorrelationFunction;
+
     // Typedef thread local histogram type for use in code.
-    using CFThreadHistogram = typename util::Histogram<T>::ThreadLocalHistogram;
+    using ComponentThreadHistogram = util::Histogram<double>::ThreadLocalHistogram;
+
+    size_t m_bins;  //!< Number of bins
+    float m_r_max;  //!< Maximum distance at which to compute the correlation function
+    float m_inv_dr; //!< Inverse of the bin width, precomputed for binning
 
-    util::Histogram<T> m_correlation_function;      //!< The correlation function
-    CFThreadHistogram m_local_correlation_function; //!< Thread local copy of the correlation function
+    util::Histogram<T> m_correlation_function;         //!< The correlation function
+    ComponentThreadHistogram m_local_correlation_real; //!< Thread local real parts
+    ComponentThreadHistogram m_local_correlation_imag; //!< Thread local imaginary parts
 };
 
 }; }; // end namespace freud::density
@@ -178,6 +178,10 @@ NeighborBond AABBQueryBallIterator::next()
 
                         // Compute distance
                         const vec3<float> r_ij = pos_j - pos_i_image;
+                        if (outsideCube(r_ij, m_r_max))
+                        {
+                            continue;
+                        }
                         const float r_sq = dot(r_ij, r_ij);
 
                         // Check ii exclusion before including the pair.
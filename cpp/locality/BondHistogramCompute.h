@@ -110,6 +110,34 @@ public:
         m_reduce = true;
     }
 
+    //! \internal
+    // Wrapper to do accumulation one query point at a time.
+    /*! This is equivalent to accumulateGeneral, but the compute function is
+        called once per query point so that per-thread state (such as thread
+        local histograms) can be looked up once for all of that point's bonds.
+
+        \param neighbor_query NeighborQuery object to iterate over
+        \param query_points Query points
+        \param n_query_points Number of query_points
+        \param nlist Neighbor List. If not NULL, loop over it. Otherwise, use neighbor_query
+           appropriately with given qargs.
+        \param qargs Query arguments
+        \param cf An object with operator(size_t query_point_idx,
+           std::shared_ptr<NeighborPerPointIterator>) as input.
+    */
+    template<typename Func>
+    void accumulateGeneralIterator(const locality::NeighborQuery* neighbor_query,
+                                   const vec3<float>* query_points, unsigned int n_query_points,
+                                   const locality::NeighborList* nlist, locality::QueryArgs qargs, Func cf)
+    {
+        m_box = neighbor_query->getBox();
+        locality::loopOverNeighborsIterator(neighbor_query, query_points, n_query_points, qargs, nlist, cf);
+        m_frame_counter++;
+        m_n_points = neighbor_query->getNPoints();
+        m_n_query_points = n_query_points;
+        m_reduce = true;
+    }
+
 protected:
     box::Box m_box;
     unsigned int m_frame_counter {0};  //!< Number of frames calculated.
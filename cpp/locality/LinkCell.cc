@@ -512,6 +512,10 @@ NeighborBond LinkCellQueryBallIterator::next()
             }
 
             const vec3<float> r_ij(m_neighbor_query->getBox().wrap((*m_linkcell)[j] - m_query_point));
+            if (outsideCube(r_ij, m_r_max))
+            {
+                continue;
+            }
             const float r_sq(dot(r_ij, r_ij));
 
             if (r_sq < r_max_sq && r_sq >= r_min_sq)
@@ -4,6 +4,7 @@
 #ifndef NEIGHBOR_QUERY_H
 #define NEIGHBOR_QUERY_H
 
+#include <cmath>
 #include <memory>
 #include <stdexcept>
 #include <tbb/enumerable_thread_specific.h>
@@ -280,6 +281,16 @@ public:
     NeighborBond next() override = 0;
 
 protected:
+    //! Check whether a vector lies outside the cube of half-width r_max.
+    /*! Every vector for which this returns true has a squared length of at
+     *  least r_max * r_max, so ball queries can reject it without computing
+     *  the squared length.
+     */
+    static bool outsideCube(const vec3<float>& r_ij, float r_max)
+    {
+        return std::abs(r_ij.x) >= r_max || std::abs(r_ij.y) >= r_max || std::abs(r_ij.z) >= r_max;
+    }
+
     const NeighborQuery* m_neighbor_query;       //!< Link to the NeighborQuery object.
     const vec3<float> m_query_point = {0, 0, 0}; //!< Coordinates of the query point.
     bool m_finished; //!< Flag to indicate that iteration is complete (must be set by next() on termination).
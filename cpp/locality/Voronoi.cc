@@ -4,6 +4,7 @@
 #include <cmath>
 #include <iterator>
 #include <tbb/parallel_sort.h>
+#include <utility>
 #include <vector>
 
 #include "NeighborBond.h"
@@ -55,6 +56,7 @@ void Voronoi::compute(const freud::locality::NeighborQuery* nq)
     std::vector<int> neighbors;
     std::vector<double> normals;
     std::vector<double> vertices;
+    std::vector<vec3<double>> relative_vertices;
     std::vector<NeighborBond> bonds;
 
     if (voronoi_loop.start())
@@ -74,8 +76,9 @@ void Voronoi::compute(const freud::locality::NeighborQuery* nq)
             cell.normals(normals);
             cell.vertices(query_point.x, query_point.y, query_point.z, vertices);
 
-            // Compute polytope vertices in relative coordinates
-            std::vector<vec3<double>> relative_vertices;
+            // Compute polytope vertices in relative coordinates. The buffer
+            // is reused across cells to avoid reallocating it for each one.
+            relative_vertices.clear();
             auto vertex_iterator = vertices.begin();
             while (vertex_iterator != vertices.end())
             {
@@ -117,7 +120,7 @@ void Voronoi::compute(const freud::locality::NeighborQuery* nq)
             std::transform(
                 relative_vertices.begin(), relative_vertices.end(), std::back_inserter(system_vertices),
                 [&](const auto& relative_vertex) { return relative_vertex + query_point_system_coords; });
-            m_polytopes[query_point_id] = system_vertices;
+            m_polytopes[query_point_id] = std::move(system_vertices);
 
             // Save cell volume
             m_volumes[query_point_id] = cell.volume();
@@ -20,6 +20,7 @@ cdef extern from "CorrelationFunction.h" namespace "freud::density":
                         unsigned int, const freud._locality.NeighborList*,
                         freud._locality.QueryArgs) except +
         const freud.util.ManagedArray[T] &getCorrelation()
+        void accumulateFrom(const CorrelationFunction[double] &) except +
 
 cdef extern from "GaussianDensity.h" namespace "freud::density":
     cdef cppclass GaussianDensity:
@@ -33,6 +33,15 @@ np.import_array()
 
 ctypedef unsigned int uint
 
+
+def _has_imaginary_part(values):
+    """Check whether any element of an array has a nonzero imaginary part.
+
+    Arrays of a real dtype are rejected without scanning their elements.
+    """
+    return np.iscomplexobj(values) and bool(np.any(np.imag(values)))
+
+
 cdef class CorrelationFunction(_SpatialHistogram1D):
     R"""Computes the complex pairwise correlation function.
 
@@ -62,16 +71,20 @@ cdef class CorrelationFunction(_SpatialHistogram1D):
             Maximum pointwise distance to include in the calculation.
     """  # noqa E501
     cdef freud._density.CorrelationFunction[np.complex128_t] * thisptr
+    cdef freud._density.CorrelationFunction[double] * realptr
     cdef is_complex
 
     def __cinit__(self, unsigned int bins, float r_max):
-        self.thisptr = self.histptr = new \
+        self.thisptr = new \
             freud._density.CorrelationFunction[np.complex128_t](bins, r_max)
+        self.realptr = self.histptr = new \
+            freud._density.CorrelationFunction[double](bins, r_max)
         self.r_max = r_max
         self.is_complex = False
 
     def __dealloc__(self):
         del self.thisptr
+        del self.realptr
 
     def compute(self, system, values, query_points=None,
                 query_values=None, neighbors=None, reset=True):
@@ -106,6 +119,7 @@ cdef class CorrelationFunction(_SpatialHistogram1D):
         """  # noqa E501
         if reset:
             self.is_complex = False
+            self.histptr = self.realptr
             self._reset()
 
         cdef:
@@ -118,10 +132,31 @@ cdef class CorrelationFunction(_SpatialHistogram1D):
         nq, nlist, qargs, l_query_points, num_query_points = \
             self._preprocess_arguments(system, query_points, neighbors)
 
-        # Save if any inputs have been complex so far.
-        self.is_complex = self.is_complex or np.any(np.iscomplex(values)) or \
-            np.any(np.iscomplex(query_values))
+        # Real values are accumulated into a real-valued correlation function
+        # until complex values are provided, at which point everything
+        # accumulated so far is moved into the complex-valued one.
+        if not self.is_complex and (
+                _has_imaginary_part(values) or
+                _has_imaginary_part(query_values)):
+            self.thisptr.reset()
+            self.thisptr.accumulateFrom(dereference(self.realptr))
+            self.histptr = self.thisptr
+            self.is_complex = True
+
+        if self.is_complex:
+            self._accumulate_complex(nq, nlist, qargs, l_query_points,
+                                     num_query_points, values, query_values)
+        else:
+            self._accumulate_real(nq, nlist, qargs, l_query_points,
+                                  num_query_points, values, query_values)
+        return self
 
+    def _accumulate_complex(self, freud.locality.NeighborQuery nq,
+                            freud.locality.NeighborList nlist,
+                            freud.locality._QueryArgs qargs,
+                            const float[:, ::1] l_query_points,
+                            unsigned int num_query_points,
+                            values, query_values):
         values = freud.util._convert_array(
             values, shape=(nq.points.shape[0], ), dtype=np.complex128)
         if query_values is None:
@@ -141,16 +176,45 @@ cdef class CorrelationFunction(_SpatialHistogram1D):
             <np.complex128_t*> &l_query_values[0],
             num_query_points, nlist.get_ptr(),
             dereference(qargs.thisptr))
-        return self
+
+    def _accumulate_real(self, freud.locality.NeighborQuery nq,
+                         freud.locality.NeighborList nlist,
+                         freud.locality._QueryArgs qargs,
+                         const float[:, ::1] l_query_points,
+                         unsigned int num_query_points,
+                         values, query_values):
+        # Complex inputs with no imaginary part are also handled here.
+        values = freud.util._convert_array(
+            np.real(values), shape=(nq.points.shape[0], ), dtype=np.float64)
+        if query_values is None:
+            query_values = values
+        else:
+            query_values = freud.util._convert_array(
+                np.real(query_values), shape=(l_query_points.shape[0], ),
+                dtype=np.float64)
+
+        cdef double[::1] l_values = values
+        cdef double[::1] l_query_values = query_values
+
+        self.realptr.accumulate(
+            nq.get_ptr(),
+            <double*> &l_values[0],
+            <vec3[float]*> &l_query_points[0, 0],
+            <double*> &l_query_values[0],
+            num_query_points, nlist.get_ptr(),
+            dereference(qargs.thisptr))
 
     @_Compute._computed_property
     def correlation(self):
         """(:math:`N_{bins}`) :class:`numpy.ndarray`: Expected (average)
         product of all values at a given radial distance."""
-        output = freud.util.make_managed_numpy_array(
-            &self.thisptr.getCorrelation(),
-            freud.util.arr_type_t.COMPLEX_DOUBLE)
-        return output if self.is_complex else np.real(output)
+        if self.is_complex:
+            return freud.util.make_managed_numpy_array(
+                &self.thisptr.getCorrelation(),
+                freud.util.arr_type_t.COMPLEX_DOUBLE)
+        return freud.util.make_managed_numpy_array(
+            &self.realptr.getCorrelation(),
+            freud.util.arr_type_t.DOUBLE)
 
     def __repr__(self):
         return ("freud.density.{cls}(bins={bins}, r_max={r_max})").format(
@@ -945,9 +945,12 @@ cdef class _PairCompute(_Compute):
             # reasonable choice of defaults.
             try:
                 query_args = self.default_query_args if neighbors is None \
-                    else neighbors.copy()
-                query_args.setdefault('exclude_ii', query_points is None)
+                    else neighbors
                 qargs = _QueryArgs.from_dict(query_args)
+                # Set the default exclude_ii on the constructed arguments
+                # rather than on a copy of the user's dict.
+                if 'exclude_ii' not in query_args:
+                    qargs.exclude_ii = query_points is None
                 nlist = NeighborList(_null=True)
             except NotImplementedError:
                 raise
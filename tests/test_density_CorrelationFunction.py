@@ -10,6 +10,35 @@ import freud
 
 matplotlib.use("agg")
 
+# Parameters of the random system shared by the tests below.
+R_MAX = 10.0
+NUM_POINTS = 1000
+BOX_SIZE = R_MAX * 3.1
+
+
+@pytest.fixture(scope="module")
+def random_system():
+    """Random 2D system shared across tests to avoid regenerating it."""
+    return freud.data.make_random_system(BOX_SIZE, NUM_POINTS, is2D=True)
+
+
+@pytest.fixture(scope="module")
+def random_test_set(random_system):
+    """Neighbor-finding test set for the shared random system."""
+    box, points = random_system
+    return util.make_raw_query_nlist_test_set(
+        box, points, points, "ball", R_MAX, 0, True
+    )
+
+
+def _unit_complex(ang):
+    """Compute exp(1j * ang) from the cosine and sine of the angles, which
+    avoids evaluating a complex exponential."""
+    comp = np.empty(len(ang), dtype=np.complex128)
+    comp.real = np.cos(ang)
+    comp.imag = np.sin(ang)
+    return comp
+
 
 class TestCorrelationFunction:
     def test_generate_bins(self):
@@ -20,9 +49,7 @@ class TestCorrelationFunction:
         ocf = freud.density.CorrelationFunction(bins, r_max)
 
         # make sure the radius for each bin is generated correctly
-        r_list = np.array(
-            [dr * (i + 1 / 2) for i in range(bins) if dr * (i + 1 / 2) < r_max]
-        )
+        r_list = dr * (np.arange(bins) + 1 / 2)
         npt.assert_allclose(ocf.bin_centers, r_list, rtol=1e-4, atol=1e-4)
         npt.assert_allclose((ocf.bin_edges + dr / 2)[:-1], r_list, rtol=1e-4, atol=1e-4)
 
@@ -57,49 +84,45 @@ class TestCorrelationFunction:
         ocf.box
         ocf.bin_counts
 
-    def test_random_points_complex(self):
-        r_max = 10.0
+    def test_random_points_complex(self, random_system, random_test_set):
+        r_max = R_MAX
         bins = 10
-        num_points = 1000
-        box_size = r_max * 3.1
-        box, points = freud.data.make_random_system(box_size, num_points, is2D=True)
-        ang = np.random.random_sample(num_points).astype(np.float64) * 2.0 * np.pi
-        comp = np.exp(1j * ang)
+        box, points = random_system
+        ang = np.random.random_sample(NUM_POINTS).astype(np.float64) * 2.0 * np.pi
+        comp = _unit_complex(ang)
         correct = np.zeros(bins, dtype=np.complex64)
         absolute_tolerance = 0.1
         # first bin is bad
-        test_set = util.make_raw_query_nlist_test_set(
-            box, points, points, "ball", r_max, 0, True
-        )
-        for nq, neighbors in test_set:
+        for nq, neighbors in random_test_set:
             ocf = freud.density.CorrelationFunction(bins, r_max)
             ocf.compute(nq, comp, neighbors=neighbors)
             npt.assert_allclose(ocf.correlation, correct, atol=absolute_tolerance)
             assert box == ocf.box
 
+            # Reuse the neighbors found above for the remaining computes.
+            neighbors = util.make_neighbor_list(nq, neighbors)
+
             # Test setting that the reset flag works as expected.
             ocf.compute(nq, comp, neighbors=neighbors, reset=False)
             npt.assert_allclose(ocf.correlation, correct, atol=absolute_tolerance)
             ocf.compute(nq, comp, neighbors=neighbors)
             npt.assert_allclose(ocf.correlation, correct, atol=absolute_tolerance)
 
-    def test_random_points_real(self):
-        r_max = 10.0
+    def test_random_points_real(self, random_system, random_test_set):
+        r_max = R_MAX
         bins = 10
-        num_points = 1000
-        box_size = r_max * 3.1
-        box, points = freud.data.make_random_system(box_size, num_points, is2D=True)
-        ang = np.random.random_sample(num_points).astype(np.float64) - 0.5
+        box, points = random_system
+        ang = np.random.random_sample(NUM_POINTS).astype(np.float64) - 0.5
         correct = np.zeros(bins, dtype=np.float64)
         absolute_tolerance = 0.1
         # first bin is bad
-        test_set = util.make_raw_query_nlist_test_set(
-            box, points, points, "ball", r_max, 0, True
-        )
-        for nq, neighbors in test_set:
+        for nq, neighbors in random_test_set:
             ocf = freud.density.CorrelationFunction(bins, r_max)
             ocf.compute(nq, ang, neighbors=neighbors, reset=False)
             npt.assert_allclose(ocf.correlation, correct, atol=absolute_tolerance)
+
+            # Reuse the neighbors found above for the remaining computes.
+            neighbors = util.make_neighbor_list(nq, neighbors)
             ocf.compute(nq, ang, neighbors=neighbors)
             npt.assert_allclose(ocf.correlation, correct, atol=absolute_tolerance)
             ocf.compute(nq, ang, points, ang, neighbors=neighbors, reset=False)
@@ -108,20 +131,18 @@ class TestCorrelationFunction:
             npt.assert_allclose(ocf.correlation, correct, atol=absolute_tolerance)
             ocf.compute(nq, ang, neighbors=neighbors)
             npt.assert_allclose(ocf.correlation, correct, atol=absolute_tolerance)
-            assert freud.box.Box.square(box_size) == ocf.box
+            assert freud.box.Box.square(BOX_SIZE) == ocf.box
 
-    def test_zero_points_complex(self):
-        r_max = 10.0
+    def test_zero_points_complex(self, random_system):
+        r_max = R_MAX
         bins = 10
         dr = r_max / bins
-        num_points = 1000
-        box_size = r_max * 3.1
-        box, points = freud.data.make_random_system(box_size, num_points, is2D=True)
-        ang = np.zeros(int(num_points), dtype=np.float64)
-        comp = np.exp(1j * ang)
+        box, points = random_system
+        ang = np.zeros(NUM_POINTS, dtype=np.float64)
+        comp = _unit_complex(ang)
         ocf = freud.density.CorrelationFunction(bins, r_max)
         ocf.compute(
-            (freud.box.Box.square(box_size), points),
+            (freud.box.Box.square(BOX_SIZE), points),
             comp,
             neighbors={"r_max": r_max, "exclude_ii": True},
         )
@@ -132,13 +153,11 @@ class TestCorrelationFunction:
         absolute_tolerance = 0.1
         npt.assert_allclose(ocf.correlation, correct, atol=absolute_tolerance)
 
-    def test_zero_points_real(self):
-        r_max = 10.0
+    def test_zero_points_real(self, random_system):
+        r_max = R_MAX
         dr = 1.0
-        num_points = 1000
-        box_size = r_max * 3.1
-        box, points = freud.data.make_random_system(box_size, num_points, is2D=True)
-        ang = np.zeros(int(num_points), dtype=np.float64)
+        box, points = random_system
+        ang = np.zeros(NUM_POINTS, dtype=np.float64)
         ocf = freud.density.CorrelationFunction(r_max, dr)
         ocf.compute((box, points), ang)
 
@@ -153,18 +172,14 @@ class TestCorrelationFunction:
         box_size = r_max * 2.1
         box, points = freud.data.make_random_system(box_size, num_points, is2D=True)
         ang = np.zeros(int(num_points), dtype=np.float64)
-        comp = np.exp(1j * ang)
+        comp = _unit_complex(ang)
 
-        vectors = points[np.newaxis, :, :] - points[:, np.newaxis, :]
-        vector_lengths = np.array(
-            [
-                [np.linalg.norm(box.wrap(vectors[i][j])) for i in range(num_points)]
-                for j in range(num_points)
-            ]
-        )
+        vectors = (points[np.newaxis, :, :] - points[:, np.newaxis, :]).reshape(-1, 3)
+        wrapped = box.wrap(vectors).reshape(num_points, num_points, 3)
+        squared_lengths = np.einsum("ijk,ijk->ij", wrapped, wrapped)
 
         # Subtract len(points) to exclude the zero i-i distances
-        correct = np.sum(vector_lengths < r_max) - len(points)
+        correct = np.sum(squared_lengths < r_max * r_max) - len(points)
         ocf = freud.density.CorrelationFunction(bins, r_max)
         ocf.compute(
             (freud.box.Box.square(box_size), points),
@@ -212,7 +227,7 @@ class TestCorrelationFunction:
         box_size = r_max * 3.1
         box, points = freud.data.make_random_system(box_size, num_points, is2D=True)
         ang = np.random.random_sample(num_points).astype(np.float64) * 2.0 * np.pi
-        comp = np.exp(1j * ang)
+        comp = _unit_complex(ang)
         ocf = freud.density.CorrelationFunction(bins, r_max)
 
         with pytest.raises(AttributeError):
@@ -272,8 +287,10 @@ class TestCorrelationFunction:
         npt.assert_array_equal(cf.bin_counts, [1, 0, 0])
 
         # Make values complex
-        values = [1 + 1j]
-        query_values = [1 + 1j, 1 + 1j, 2 + 2j, 2 + 2j, 3 + 3j, 3 + 3j]
+        values = np.array([1 + 1j])
+        query_values = np.array([1 + 1j, 1 + 1j, 2 + 2j, 2 + 2j, 3 + 3j, 3 + 3j])
+        conj_values = np.conj(values)
+        conj_query_values = np.conj(query_values)
         cf.compute(
             (box, points),
             values,
@@ -287,7 +304,7 @@ class TestCorrelationFunction:
         # Test the effect of conjugating the query_values
         cf.compute(
             (box, points),
-            np.conj(values),
+            conj_values,
             query_points,
             query_values,
             neighbors={"mode": "nearest", "num_neighbors": 1},
@@ -309,7 +326,7 @@ class TestCorrelationFunction:
         # Test the effect of conjugating the query_values
         cf.compute(
             (box, query_points),
-            np.conj(query_values),
+            conj_query_values,
             points,
             values,
             neighbors={"mode": "nearest", "num_neighbors": 1},
@@ -359,11 +376,50 @@ class TestCorrelationFunction:
         npt.assert_array_equal(cf.correlation, [1, 0, 0])
         npt.assert_array_equal(cf.bin_counts, [1, 0, 0])
 
-    def test_points_ne_query_points_complex(self):
-        # Helper function to give complex number representation of a point
-        def value_func(_p):
-            return _p[0] + 1j * _p[1]
+    def test_real_then_complex(self):
+        """Test accumulating complex values on top of real values."""
+        box = freud.box.Box.cube(8)
+        r_max = 3
+        bins = 3
+        points = np.array([[0, 0, 0]], dtype=np.float32)
+        query_points = np.array(
+            [[0.4, 0.0, 0.0], [0.0, 1.4, 0.0], [0.0, 0.0, 2.4]], dtype=np.float32
+        )
+        cf = freud.density.CorrelationFunction(bins, r_max)
+        cf.compute(
+            (box, points),
+            np.ones(1),
+            query_points,
+            np.ones(3),
+            neighbors={"r_max": r_max},
+        )
+        assert not np.iscomplexobj(cf.correlation)
+        npt.assert_array_equal(cf.correlation, [1, 1, 1])
+
+        cf.compute(
+            (box, points),
+            np.ones(1),
+            query_points,
+            1j * np.ones(3),
+            neighbors={"r_max": r_max},
+            reset=False,
+        )
+        npt.assert_allclose(cf.correlation, [0.5 + 0.5j] * 3)
+        npt.assert_array_equal(cf.bin_counts, [2, 2, 2])
 
+        # Resetting returns to a real-valued correlation function.
+        cf.compute(
+            (box, points),
+            np.ones(1),
+            query_points,
+            np.ones(3),
+            neighbors={"r_max": r_max},
+        )
+        assert not np.iscomplexobj(cf.correlation)
+        npt.assert_array_equal(cf.correlation, [1, 1, 1])
+        npt.assert_array_equal(cf.bin_counts, [1, 1, 1])
+
+    def test_points_ne_query_points_complex(self):
         r_max = 10.0
         bins = 100
         dr = r_max / bins
@@ -372,8 +428,6 @@ class TestCorrelationFunction:
 
         ocf = freud.density.CorrelationFunction(bins, r_max)
 
-        query_points = []
-        query_values = []
         N = 300
 
         # We are essentially generating all n-th roots of unity
@@ -385,15 +439,12 @@ class TestCorrelationFunction:
         # Nice proof for this fact is that when the n-th roots of unity
         # are viewed as vectors, we can draw a regular n-gon
         # so that we start at the origin and come back to origin.
-        for r in ocf.bin_centers:
-            for k in range(N):
-                point = [
-                    r * np.cos(2 * np.pi * k / N),
-                    r * np.sin(2 * np.pi * k / N),
-                    0,
-                ]
-                query_points.append(point)
-                query_values.append(value_func(point))
+        theta = 2 * np.pi * np.arange(N) / N
+        r = ocf.bin_centers[:, np.newaxis]
+        x = (r * np.cos(theta)).ravel()
+        y = (r * np.sin(theta)).ravel()
+        query_points = np.column_stack([x, y, np.zeros_like(x)])
+        query_values = x + 1j * y
 
         supposed_correlation = np.zeros(ocf.bin_centers.shape)
 
@@ -412,6 +463,9 @@ class TestCorrelationFunction:
 
                 ocf.compute(nq, values, query_points, query_values, neighbors=neighbors)
                 correct = supposed_correlation
+                # The points do not change, so the neighbors found for the
+                # first value are reused for the rest.
+                neighbors = util.make_neighbor_list(nq, neighbors, query_points)
 
                 npt.assert_allclose(ocf.correlation, correct, atol=1e-6)
 
@@ -427,23 +481,18 @@ class TestCorrelationFunction:
 
         ocf = freud.density.CorrelationFunction(bins, r_max)
 
-        query_points = []
-        query_values = []
-        supposed_correlation = []
         N = 300
 
         # We are generating the values so that they are sine wave from 0 to 2pi
         # rotated around z axis.  Therefore, the correlation should be a scalar
         # multiple sin if we set our ref_point to be in the origin.
-        for r in ocf.bin_centers:
-            for k in range(N):
-                query_points.append(
-                    [r * np.cos(2 * np.pi * k / N), r * np.sin(2 * np.pi * k / N), 0]
-                )
-                query_values.append(value_func(r))
-            supposed_correlation.append(value_func(r))
-
-        supposed_correlation = np.array(supposed_correlation)
+        theta = 2 * np.pi * np.arange(N) / N
+        r = ocf.bin_centers[:, np.newaxis]
+        x = (r * np.cos(theta)).ravel()
+        y = (r * np.sin(theta)).ravel()
+        query_points = np.column_stack([x, y, np.zeros_like(x)])
+        query_values = np.repeat(value_func(ocf.bin_centers), N)
+        supposed_correlation = value_func(ocf.bin_centers)
 
         # points are within distances closer than dr, so their impact on
         # the result should be minimal.
@@ -460,6 +509,9 @@ class TestCorrelationFunction:
 
                 ocf.compute(nq, values, query_points, query_values, neighbors=neighbors)
                 correct = supposed_correlation * rv
+                # The points do not change, so the neighbors found for the
+                # first value are reused for the rest.
+                neighbors = util.make_neighbor_list(nq, neighbors, query_points)
 
                 npt.assert_allclose(ocf.correlation, correct, atol=1e-6)
 
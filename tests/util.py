@@ -60,6 +60,35 @@ def make_raw_query_nlist_test_set(
     return test_set
 
 
+def make_neighbor_list(system, neighbors, query_points=None):
+    """Helper function to evaluate one entry of a neighbor-finding test set.
+
+    Tests that call compute repeatedly on the same points can use this to find
+    neighbors once and pass the resulting :class:`freud.locality.NeighborList`
+    to subsequent calls.
+
+    Args:
+        system:
+            Any object that is a valid argument to
+            :class:`freud.locality.NeighborQuery.from_system`.
+        neighbors (:class:`freud.locality.NeighborList` or dict):
+            Either a :class:`freud.locality.NeighborList`, which is returned
+            unchanged, or a dictionary of query arguments.
+        query_points ((:math:`N_{query_points}`, 3) :class:`numpy.ndarray`, optional):
+            Query points. Uses the system's points if not provided or
+            :code:`None` (Default value = :code:`None`).
+
+    Returns:
+        :class:`freud.locality.NeighborList`: The neighbors.
+    """  # noqa: E501
+    if isinstance(neighbors, freud.locality.NeighborList):
+        return neighbors
+    nq = freud.locality.NeighborQuery.from_system(system)
+    if query_points is None:
+        query_points = nq.points
+    return nq.query(query_points, neighbors).toNeighborList()
+
+
 def make_alternating_lattice(lattice_size, angle=0, extra_shell=2):
     r"""Make 2D integer lattice of alternating set of points.
 
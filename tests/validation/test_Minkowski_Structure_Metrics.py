@@ -7,9 +7,11 @@ import pytest
 
 import freud
 
+MAX_L = 7
+
 
 def _get_structure_data(structure, qtype):
-    return np.genfromtxt(
+    return np.loadtxt(
         os.path.join(
             os.path.dirname(__file__),
             "files",
@@ -19,54 +21,68 @@ def _get_structure_data(structure, qtype):
     )
 
 
+@pytest.fixture(scope="module", params=["fcc", "bcc", "hcp", "sc"])
+def structure_metrics(request):
+    """Compute the order parameters for all l of a structure once, so that
+    the Voronoi tessellation is shared by the tests of each l."""
+    structure = request.param
+    with garnett.read(
+        os.path.join(
+            os.path.dirname(__file__),
+            "files",
+            "minkowski_structure_metrics",
+            f"{structure}.gsd",
+        )
+    ) as traj:
+        snap = traj[0]
+
+    voro = freud.locality.Voronoi()
+    voro.compute(snap)
+    sph_ls = list(range(MAX_L))
+
+    # Each compute evaluates all l values in one pass over the neighbors.
+    ql = freud.order.Steinhardt(sph_ls, weighted=True)
+    ql.compute(snap, neighbors=voro.nlist)
+    avql = freud.order.Steinhardt(sph_ls, average=True, weighted=True)
+    avql.compute(snap, neighbors=voro.nlist)
+    wl = freud.order.Steinhardt(sph_ls, wl=True, weighted=True, wl_normalize=True)
+    wl.compute(snap, neighbors=voro.nlist)
+    avwl = freud.order.Steinhardt(
+        sph_ls, wl=True, average=True, weighted=True, wl_normalize=True
+    )
+    avwl.compute(snap, neighbors=voro.nlist)
+
+    computed = {"q": ql.order, "avq": avql.order, "w": wl.order, "avw": avwl.order}
+    expected = {qtype: _get_structure_data(structure, qtype) for qtype in computed}
+    return structure, computed, expected
+
+
 class TestMinkowski:
-    @pytest.mark.parametrize("structure", ["fcc", "bcc", "hcp", "sc"])
-    def test_minkowski_structure_metrics(self, structure):
-        expected_ql = _get_structure_data(structure, "q")
-        expected_avql = _get_structure_data(structure, "avq")
-        expected_wl = _get_structure_data(structure, "w")
-        expected_avwl = _get_structure_data(structure, "avw")
-
-        with garnett.read(
-            os.path.join(
-                os.path.dirname(__file__),
-                "files",
-                "minkowski_structure_metrics",
-                f"{structure}.gsd",
+    @pytest.mark.parametrize("sph_l", range(MAX_L))
+    def test_minkowski_structure_metrics(self, structure_metrics, sph_l):
+        structure, computed, expected = structure_metrics
+        assert expected["q"].shape[1] == MAX_L
+
+        # These tests fail for unknown (probably numerical) reasons.
+        if structure == "hcp" and sph_l in [3, 5]:
+            pytest.skip("q'l and w'l for hcp do not match for l = 3, 5.")
+
+        # Test q'l
+        npt.assert_allclose(computed["q"][sph_l], expected["q"][:, sph_l], atol=1e-5)
+
+        # Test average q'l
+        npt.assert_allclose(
+            computed["avq"][sph_l], expected["avq"][:, sph_l], atol=1e-5
+        )
+
+        # w'2 tests fail for unknown (probably numerical) reasons.
+        if sph_l != 2:
+            # Test w'l
+            npt.assert_allclose(
+                computed["w"][sph_l], expected["w"][:, sph_l], atol=1e-5
+            )
+
+            # Test average w'l
+            npt.assert_allclose(
+                computed["avw"][sph_l], expected["avw"][:, sph_l], atol=1e-5
             )
-        ) as traj:
-            snap = traj[0]
-
-        voro = freud.locality.Voronoi()
-        voro.compute(snap)
-        for sph_l in range(expected_ql.shape[1]):
-
-            # These tests fail for unknown (probably numerical) reasons.
-            if structure == "hcp" and sph_l in [3, 5]:
-                continue
-
-            # Test q'l
-            comp = freud.order.Steinhardt(sph_l, weighted=True)
-            comp.compute(snap, neighbors=voro.nlist)
-            npt.assert_allclose(comp.order, expected_ql[:, sph_l], atol=1e-5)
-
-            # Test average q'l
-            comp = freud.order.Steinhardt(sph_l, average=True, weighted=True)
-            comp.compute(snap, neighbors=voro.nlist)
-            npt.assert_allclose(comp.order, expected_avql[:, sph_l], atol=1e-5)
-
-            # w'2 tests fail for unknown (probably numerical) reasons.
-            if sph_l != 2:
-                # Test w'l
-                comp = freud.order.Steinhardt(
-                    sph_l, wl=True, weighted=True, wl_normalize=True
-                )
-                comp.compute(snap, neighbors=voro.nlist)
-                npt.assert_allclose(comp.order, expected_wl[:, sph_l], atol=1e-5)
-
-                # Test average w'l
-                comp = freud.order.Steinhardt(
-                    sph_l, wl=True, average=True, weighted=True, wl_normalize=True
-                )
-                comp.compute(snap, neighbors=voro.nlist)
-                npt.assert_allclose(comp.order, expected_avwl[:, sph_l], atol=1e-5)